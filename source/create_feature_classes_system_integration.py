@@ -18,6 +18,21 @@
 #	procedures that harvest coordinate and attribute information from the
 #	systems of record.
 #
+#	Select the feature classes to create with --fc (e.g. --fc well_permits
+#	wup_wells) or --all; run with --help to list the names.
+#
+#	Feature classes that already exist with the current schema and indexes
+#	are truncated rather than recreated. If any existing feature class has
+#	an outdated schema or missing indexes, the script stops before changing
+#	anything; specify --force to delete and recreate existing feature
+#	classes.
+#
+#	Feature classes are created with the GIS_BULK configuration keyword,
+#	which must be added to the SDE.DBTUNE table by the DBA before running
+#	this script. GIS_BULK should inherit the DEFAULTS parameters, store
+#	attribute data (UI_TEXT) inline, and omit log file table storage. The
+#	script stops before changing anything if the keyword is missing.
+#
 # History:
 #	20140919 MCM Created
 #	20150126 MCM Added GIS.DATABASES_ORPHAN_WELLS
@@ -79,10 +94,27 @@
 #	               (NWFWMDDI-89)
 #	20190905 MCM Expanded DATABASES_WELL_PERMITS.RELATED_PERMIT to
 #	               RELATED_PERMIT_1 and RELATED_PERMIT_2 (NWFWMDDI-90)
+#	20261015     Replaced per-feature class functions with FEATURE_CLASSES
+#	               definition table and --fc / --all options
+#	             Created feature classes concurrently from in_memory
+#	               templates with GIS_BULK configuration keyword
+#	             Created indexes and grants in SQL batches with fallbacks
+#	             Truncated current feature classes; recreated with --force
+#	             Deferred arcpy import until first use
 #
 # To do:
 #	Evaluate changing other/all LONG to DOUBLE (without P,S?) to avoid
 #	overflow
+#	DOUBLE identifier columns sourced from NWPROD (e.g. SITE_ID,
+#	PERMIT_NUMBER, APPLICATION_NUMBER, ITEM_NUMBER, LEGACY_APNUM, NWF_ID)
+#	could be stored as LONG only if the source system documents values
+#	below 2^31; none do at present, so they remain DOUBLE per 20150601
+#	Proposal (pending stakeholder sign-off): replace the identical
+#	DATABASES_ERP_SITE_<subset> feature classes with a single
+#	DATABASES_ERP_SITE_SUBSET feature class using FIELDS_ERP_SITE_BASE plus
+#	an indexed SUBSET_CODE TEXT(16) column ('40A_4', '40A_44', '62_330',
+#	'FORESTRY'); requires updating GIS_REFRESH.REFRESH_DATABASES_ERP_SITE
+#	and all consumers of the subset feature classes
 #
 # Copyright 2003-2019. Mannion Geosystems, LLC. http://www.manniongeo.com
 ################################################################################
@@ -92,8 +124,12 @@
 # Modules
 #
 
-import arcpy
+import argparse
+import collections
+import functools
+import multiprocessing
 import os
+import sys
 
 
 
@@ -102,7 +138,19 @@ import os
 #
 
 OUTPUT_GEODATABASE = r'Database Connections\orcl$gis.sde'
-UTM_16N_NAD83 = arcpy.SpatialReference(26916) # NAD_1983_UTM_Zone_16N
+SCHEMA_TEMPLATE_WORKSPACE = 'in_memory'
+CONFIG_KEYWORD = 'GIS_BULK' # See Notes
+UTM_16N_NAD83 = None # NAD_1983_UTM_Zone_16N; built by lazy_init
+MAX_WORKERS = 8 # Concurrent feature class creation processes
+
+# Field types reported by arcpy.ListFields for each field specification type
+FIELD_TYPE_NAMES = {
+	'DATE': 'Date'
+	,'DOUBLE': 'Double'
+	,'LONG': 'Integer'
+	,'SHORT': 'SmallInteger'
+	,'TEXT': 'String'
+}
 
 # Feature class names
 FC_NAME_ERP = 'GIS.DATABASES_ERP'
@@ -119,20 +167,89 @@ FC_NAME_WUP_PERMITTED = 'GIS.DATABASES_WUP_PERMITTED'
 FC_NAME_WUP_SURFACE = 'GIS.DATABASES_WUP_SURFACE'
 FC_NAME_WUP_WELLS = 'GIS.DATABASES_WUP_WELLS'
 
+# Feature class paths
+FC_PATH_ERP = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP)
+FC_PATH_ERP_SITE = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP_SITE)
+FC_PATH_ERP_SITE_40A_4 = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP_SITE_40A_4)
+FC_PATH_ERP_SITE_40A_44 = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP_SITE_40A_44)
+FC_PATH_ERP_SITE_62_330 = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP_SITE_62_330)
+FC_PATH_ERP_SITE_FORESTRY = os.path.join(OUTPUT_GEODATABASE, FC_NAME_ERP_SITE_FORESTRY)
+FC_PATH_MSSW = os.path.join(OUTPUT_GEODATABASE, FC_NAME_MSSW)
+FC_PATH_REG_STATION = os.path.join(OUTPUT_GEODATABASE, FC_NAME_REG_STATION)
+FC_PATH_WI = os.path.join(OUTPUT_GEODATABASE, FC_NAME_WI)
+FC_PATH_WPS = os.path.join(OUTPUT_GEODATABASE, FC_NAME_WPS)
+FC_PATH_WUP_PERMITTED = os.path.join(OUTPUT_GEODATABASE, FC_NAME_WUP_PERMITTED)
+FC_PATH_WUP_SURFACE = os.path.join(OUTPUT_GEODATABASE, FC_NAME_WUP_SURFACE)
+FC_PATH_WUP_WELLS = os.path.join(OUTPUT_GEODATABASE, FC_NAME_WUP_WELLS)
+
 
 
 ################################################################################
 # Utility functions
 ################################################################################
 
+def lazy_init():
+
+	#
+	# Import arcpy and build the spatial reference on first use rather than at
+	# module import, which takes several seconds; call before any function
+	# that uses arcpy
+	#
+	# Geoprocessing history is not logged to the metadata of the feature
+	# classes being rebuilt
+	#
+
+	global arcpy
+	global UTM_16N_NAD83
+
+	if UTM_16N_NAD83 is not None:
+
+		return
+
+	import arcpy
+
+	arcpy.SetLogHistory(False)
+
+	UTM_16N_NAD83 = arcpy.SpatialReference(26916)
+
+
+
 def add_fields (
 	table
 	,fields_spec
+	,field_descriptions
+	,messages
 ):
 
-	for field_spec in fields_spec:
+	messages.append((
+		'MESSAGE'
+		,'\n'.join(
+			'\t\tAdding {field_name}'.format(field_name = field_spec[0])
+			for field_spec in fields_spec
+		)
+	))
+
+
+	#
+	# Add all fields in a single transaction when the AddFields tool is
+	# available (ArcGIS Pro 2.5+) and the specification could be translated
+	# to AddFields field descriptions
+	#
+
+	if (
+		field_descriptions is not None
+		and hasattr(arcpy.management, 'AddFields')
+	):
+
+		arcpy.management.AddFields(
+			in_table = table
+			,field_description = field_descriptions
+		)
 
-		arcpy.AddMessage('\t\tAdding {field_name}'.format(field_name = field_spec[0]))
+		return
+
+
+	for field_spec in fields_spec:
 
 		arcpy.AddField_management(
 			in_table = table
@@ -149,935 +266,869 @@ def add_fields (
 
 
 
-################################################################################
-# Feature class creation functions
-################################################################################
-
-
-#
-# GIS.DATABASES_ERP
-#
-
-def create_databases_erp():
+def build_template (
+	fc
+	,messages
+):
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP))
+	#
+	# Build an empty copy of the feature class schema in memory; the
+	# enterprise geodatabase feature class is then created from it in one
+	# operation rather than one operation per field
+	#
 
-	fc_erp = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP
+	template = os.path.join(
+		SCHEMA_TEMPLATE_WORKSPACE
+		,fc.name.split('.')[-1]
 	)
 
-
 	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP
+		out_path = SCHEMA_TEMPLATE_WORKSPACE
+		,out_name = fc.name.split('.')[-1]
 		,geometry_type = 'POINT'
 		,spatial_reference = UTM_16N_NAD83
 	)
 
-
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('application_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('applicant_first_name'	,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('applicant_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('applicant_company_name'	,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_address'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('rule_type'			,'TEXT'		,''		,''	,17		,''	,True		,''		,'')
-	]
-
-
 	add_fields(
-		table = fc_erp
-		,fields_spec = fields_spec
+		table = template
+		,fields_spec = fc.fields
+		,field_descriptions = ADD_FIELDS_DESCRIPTIONS[fc.name]
+		,messages = messages
 	)
 
+	return template
 
-	arcpy.AddMessage('\tGranting privileges')
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
 
+def create_indexes (
+	fc
+	,messages
+):
 
+	#
+	# Create all indexes in one anonymous PL/SQL block so that they share a
+	# single database round trip; indexes are named <table>__I<n> in column
+	# order. If the block fails, fall back to creating each index that does
+	# not yet exist with the geoprocessing tool
+	#
 
-#
-# GIS.DATABASES_ERP_SITE
-#
+	log_lines = ['\tCreating indexes']
+	index_names = []
+	statements = []
 
-def create_databases_erp_site():
+	for index_number, column_name in enumerate(fc.indexes, 1):
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP_SITE))
+		index_name = '{table_name}__I{index_number}'.format(
+			table_name = fc.name
+			,index_number = index_number
+		)
 
-	fc_erp_site = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP_SITE
-	)
+		index_names.append(index_name)
 
+		log_lines.append('\t\tCreating {index_name}'.format(index_name = index_name))
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP_SITE
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+		statements.append(
+			"\tEXECUTE IMMEDIATE 'CREATE INDEX {index_name} ON {table_name} ({column_name})';".format(
+				index_name = index_name
+				,table_name = fc.name
+				,column_name = column_name
+			)
+		)
 
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('party_role'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('party_company_name'		,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
-		,('party_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('party_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
+	messages.append(('MESSAGE', '\n'.join(log_lines)))
 
 
-	add_fields(
-		table = fc_erp_site
-		,fields_spec = fields_spec
-	)
+	try:
 
+		sde_connection = arcpy.ArcSDESQLExecute(OUTPUT_GEODATABASE)
 
-	arcpy.AddMessage('\tGranting privileges')
+		sde_connection.execute('BEGIN\n{statements}\nEND;'.format(statements = '\n'.join(statements)))
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp_site
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+	except Exception as e:
 
+		messages.append(('WARNING', '\tSQL index creation failed; creating with AddIndex instead: {error}'.format(error = e)))
 
+		existing_index_names = set(
+			index.name.split('.')[-1].upper()
+			for index in arcpy.ListIndexes(fc.path)
+		)
 
-#
-# GIS.DATABASES_ERP_SITE_40A_4
-#
+		for index_name, column_name in zip(index_names, fc.indexes):
 
-def create_databases_erp_site_40a_4():
+			if index_name.split('.')[-1].upper() in existing_index_names:
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP_SITE_40A_4))
+				continue
 
-	fc_erp_site_40a_4 = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP_SITE_40A_4
-	)
+			arcpy.AddIndex_management(
+				in_table = fc.path
+				,fields = column_name
+				,index_name = index_name.split('.')[-1]
+			)
 
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP_SITE_40A_4
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
 
+def grant_privileges (
+	fcs
+	,messages
+):
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
+	#
+	# Grant read access on all tables in one anonymous PL/SQL block so that
+	# the grants share a single database round trip; like ChangePrivileges,
+	# the block also grants on the ST_Geometry spatial index table
+	# (S<index_id>_IDX$) of each table. If the block fails, fall back to
+	# granting on each table with the geoprocessing tool (grants that already
+	# succeeded are simply reissued)
+	#
 
+	messages.append((
+		'MESSAGE'
+		,'\n\nGranting privileges\n' + '\n'.join(
+			'\tGranting privileges on {table_name}'.format(table_name = fc.name)
+			for fc in fcs
+		)
+	))
 
-	add_fields(
-		table = fc_erp_site_40a_4
-		,fields_spec = fields_spec
+	statements = [
+		"\tEXECUTE IMMEDIATE 'GRANT SELECT ON {table_name} TO GIS_READ';".format(table_name = fc.name)
+		for fc in fcs
+	]
+
+	statements.append(
+		"\tFOR spatial_index IN (SELECT owner, index_id FROM SDE.ST_GEOMETRY_INDEX WHERE owner || '.' || table_name IN ({table_names})) LOOP\n"
+		"\t\tEXECUTE IMMEDIATE 'GRANT SELECT ON ' || spatial_index.owner || '.S' || spatial_index.index_id || '_IDX$ TO GIS_READ';\n"
+		"\tEND LOOP;".format(
+			table_names = ', '.join(
+				"'{table_name}'".format(table_name = fc.name)
+				for fc in fcs
+			)
+		)
 	)
 
 
-	arcpy.AddMessage('\tGranting privileges')
+	try:
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp_site_40a_4
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+		sde_connection = arcpy.ArcSDESQLExecute(OUTPUT_GEODATABASE)
 
+		sde_connection.execute('BEGIN\n{statements}\nEND;'.format(statements = '\n'.join(statements)))
 
+	except Exception as e:
 
-#
-# GIS.DATABASES_ERP_SITE_40A_44
-#
+		messages.append(('WARNING', '\tSQL grant failed; granting with ChangePrivileges instead: {error}'.format(error = e)))
 
-def create_databases_erp_site_40a_44():
+		for fc in fcs:
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP_SITE_40A_44))
+			arcpy.ChangePrivileges_management(
+				in_dataset = fc.path
+				,user = 'GIS_READ'
+				,View = 'GRANT'
+				,Edit = 'AS_IS'
+			)
 
-	fc_erp_site_40a_44 = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP_SITE_40A_44
-	)
 
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP_SITE_40A_44
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
+def schema_matches (
+	fc
+):
+
+	#
+	# Compare the attribute fields of an existing feature class with its
+	# field specification: same field names, types, and text lengths
+	#
+
+	existing_fields = dict(
+		(field.name.lower(), field)
+		for field in arcpy.ListFields(fc.path)
+		if field.type not in ('OID', 'Geometry')
 	)
 
+	if set(existing_fields) != set(field_spec[0].lower() for field_spec in fc.fields):
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
+		return False
 
+	for field_spec in fc.fields:
 
-	add_fields(
-		table = fc_erp_site_40a_44
-		,fields_spec = fields_spec
-	)
+		field = existing_fields[field_spec[0].lower()]
 
+		if field.type != FIELD_TYPE_NAMES.get(field_spec[1]):
 
-	arcpy.AddMessage('\tGranting privileges')
+			return False
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp_site_40a_44
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+		if field_spec[1] == 'TEXT' and field.length != field_spec[4]:
 
+			return False
 
+	return True
 
-#
-# GIS.DATABASES_ERP_SITE_62_330
-#
 
-def create_databases_erp_site_62_330():
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP_SITE_62_330))
+def indexes_match (
+	fc
+):
 
-	fc_erp_site_62_330 = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP_SITE_62_330
-	)
+	#
+	# Check that an existing feature class has a single-column index on each
+	# indexed column in its definition
+	#
 
+	indexed_columns = set(
+		index.fields[0].name.lower()
+		for index in arcpy.ListIndexes(fc.path)
+		if len(index.fields) == 1
+	)
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP_SITE_62_330
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
+	return all(
+		column_name.lower() in indexed_columns
+		for column_name in fc.indexes
 	)
 
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
 
+def emit_messages (
+	messages
+):
 
-	add_fields(
-		table = fc_erp_site_62_330
-		,fields_spec = fields_spec
-	)
+	#
+	# Emit (severity, text) pairs collected by create_one as geoprocessing
+	# messages
+	#
 
+	for severity, text in messages:
 
-	arcpy.AddMessage('\tGranting privileges')
+		if severity == 'ERROR':
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp_site_62_330
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+			arcpy.AddError(text)
 
+		elif severity == 'WARNING':
 
+			arcpy.AddWarning(text)
 
-#
-# GIS.DATABASES_ERP_SITE_FORESTRY
-#
+		else:
 
-def create_databases_erp_site_forestry():
+			arcpy.AddMessage(text)
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_ERP_SITE_FORESTRY))
 
-	fc_erp_site_forestry = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_ERP_SITE_FORESTRY
-	)
 
+def to_add_fields_desc (
+	fields_spec
+):
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_ERP_SITE_FORESTRY
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+	#
+	# Translate a field specification to AddFields field descriptions.
+	# AddFields does not accept precision, scale, nullability, or required
+	# flags, so specifications that set any of them have no description and
+	# fall back to AddField
+	#
+
+	if not all(
+		field_spec[2] == ''
+		and field_spec[3] == ''
+		and field_spec[6] in ('', True)
+		and field_spec[7] in ('', False)
+		for field_spec in fields_spec
+	):
 
+		return None
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	return [
+		#name		,type		,alias		,length		,default	,domain
+		[field_spec[0]	,field_spec[1]	,field_spec[5]	,field_spec[4]	,''		,field_spec[8]]
+		for field_spec in fields_spec
 	]
 
 
-	add_fields(
-		table = fc_erp_site_forestry
-		,fields_spec = fields_spec
-	)
 
+################################################################################
+# Feature class schemas
+################################################################################
 
-	arcpy.AddMessage('\tGranting privileges')
-
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_erp_site_forestry
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+#
+# GIS.DATABASES_ERP
+#
 
+FIELDS_ERP = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('application_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('applicant_first_name'	,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('applicant_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('applicant_company_name'	,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
+	,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
+	,('project_address'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
+	,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('rule_type'			,'TEXT'		,''		,''	,17		,''	,True		,''		,'')
+)
 
 
 #
-# GIS.DATABASES_MSSW
+# GIS.DATABASES_ERP_SITE and GIS.DATABASES_ERP_SITE_<subset>
+#
+# Subset feature classes share the master feature class schema without the
+# PARTY_% columns, which the master feature class has after SITE_LOCATION
 #
 
-def create_databases_mssw():
-
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_MSSW))
+FIELDS_ERP_SITE_BASE_HEAD = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('site_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('permit_number'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('rule_code'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('rule_description'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
+	,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
+	,('project_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
+	,('site_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
+)
+
+FIELDS_ERP_SITE_BASE_TAIL = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('review_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('item_number'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('item_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('item_stage'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+)
+
+FIELDS_ERP_SITE_PARTY = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('party_role'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('party_company_name'		,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
+	,('party_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('party_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+)
+
+FIELDS_ERP_SITE_BASE = FIELDS_ERP_SITE_BASE_HEAD + FIELDS_ERP_SITE_BASE_TAIL
+
+FIELDS_ERP_SITE = FIELDS_ERP_SITE_BASE_HEAD + FIELDS_ERP_SITE_PARTY + FIELDS_ERP_SITE_BASE_TAIL
 
-	fc_mssw = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_MSSW
-	)
 
+#
+# GIS.DATABASES_MSSW
+#
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_MSSW
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+FIELDS_MSSW = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('permit_number'		,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('appl_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('appl_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('applicant_company_name'	,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
+	,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
+	,('appl_received'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+)
 
 
-	arcpy.AddMessage('\tAdding fields')
+#
+# GIS.DATABASES_REG_STATION
+#
 
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('permit_number'		,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('appl_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('appl_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('applicant_company_name'	,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('appl_received'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-	]
+FIELDS_REG_STATION = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('station_id'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
+	,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('station_type'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('monitoring_well_type'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('station_name'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('station_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_source_type'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_source_name'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('meter_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('well_depth'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('pump_rate'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('pumping_report'		,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('wq_mi'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('wq_lp'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('wl_gw'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('station_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
+	,('station_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
+	,('location_method'		,'TEXT'		,''		,''	,16		,''	,True		,''		,'')
+	,('project_primary_use'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('project_secondary_use'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_use_level_1'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_use_level_2'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_use_level_3'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('water_use_level_4'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('station_allocation_gpd'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('project_allocation_gpd'	,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('project_allocation_monthly'	,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('owner_company_name'		,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
+	,('owner_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('owner_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('legacy_apnum'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('nwf_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('wps_permit'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+)
 
 
-	add_fields(
-		table = fc_mssw
-		,fields_spec = fields_spec
-	)
+#
+# GIS.DATABASES_WELL_INVENTORY
+#
 
+FIELDS_WI = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('nwf_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('site_id'			,'TEXT'		,''		,''	,15		,''	,True		,''		,'')
+	,('site_type'			,'TEXT'		,''		,''	,1		,''	,True		,''		,'')
+	,('well_name'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('first_name'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('last_name'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('well_depth'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('casing_depth'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('use_permit'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('cps_permit'			,'TEXT'		,''		,''	,10		,''	,True		,''		,'')
+	,('state_id'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('spcap'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('calc_trans'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('loc_method'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+)
 
-	arcpy.AddMessage('\tGranting privileges')
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_mssw
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+#
+# GIS.DATABASES_WELL_PERMITS
+#
 
+FIELDS_WPS = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('permit_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('related_permit_1'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('related_permit_2'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('job_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('status'			,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
+	,('official_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('completion_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('exemption'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('owner_first'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('owner_last'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('well_use'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('appl_well_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('appl_casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('wcr_well_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('wcr_casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('open_hole_from'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('open_hole_to'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('screen_from'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('screen_to'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('well_street'			,'TEXT'		,''		,''	,60		,''	,True		,''		,'')
+	,('well_street_2'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('well_city'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('well_county'			,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
+	,('parcel_id'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('latitude'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('longitude'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('township'			,'TEXT'		,''		,''	,3		,''	,True		,''		,'')
+	,('range'			,'TEXT'		,''		,''	,3		,''	,True		,''		,'')
+	,('section'			,'SHORT'	,''		,''	,''		,''	,True		,''		,'')
+	,('cu_permit'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('location_method'		,'TEXT'		,''		,''	,16		,''	,True		,''		,'')
+	,('contractor_license'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('contractor_name'		,'TEXT'		,''		,''	,70		,''	,True		,''		,'')
+	,('wrca'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('arc'				,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('grout_line'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('construction_method'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('w62_524'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
+	,('stn_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+)
 
 
 #
-# GIS.DATABASES_REG_STATION
+# GIS.DATABASES_WUP_PERMITTED
 #
 
-def create_databases_reg_station():
+FIELDS_WUP_PERMITTED = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('permit_number'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
+	,('owner_first_name'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
+	,('owner_last_name'		,'TEXT'		,''		,''	,40		,''	,True		,''		,'')
+	,('project_name'		,'TEXT'		,''		,''	,80		,''	,True		,''		,'')
+	,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('rule_type'			,'TEXT'		,''		,''	,15		,''	,True		,''		,'')
+)
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_REG_STATION))
 
-	fc_reg_station = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_REG_STATION
-	)
+#
+# GIS.DATABASES_WUP_SURFACE
+#
 
+FIELDS_WUP_SURFACE = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('cu_apnum'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('cu_permit'			,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('ownerlast'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('ownerfirst'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('address'			,'TEXT'		,''		,''	,500		,''	,True		,''		,'')
+	,('pmtmaxmonthly'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('pmtavggpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('primaryuse'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('other_uses'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('expire_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('swstateid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('swkey'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('loc_method'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+)
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_REG_STATION
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
 
+#
+# GIS.DATABASES_WUP_WELLS
+#
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('station_id'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('project_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('permit_type'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('county_fips'			,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('official_permit_number'	,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('sequence_number'		,'TEXT'		,''		,''	,8		,''	,True		,''		,'')
-		,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('station_type'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('monitoring_well_type'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('station_name'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('station_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_source_type'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_source_name'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('meter_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('well_depth'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('pump_rate'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('pumping_report'		,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('wq_mi'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('wq_lp'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('wl_gw'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('station_county'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('station_location'		,'TEXT'		,''		,''	,1000		,''	,True		,''		,'')
-		,('location_method'		,'TEXT'		,''		,''	,16		,''	,True		,''		,'')
-		,('project_primary_use'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('project_secondary_use'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_use_level_1'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_use_level_2'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_use_level_3'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('water_use_level_4'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('station_allocation_gpd'	,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('project_allocation_gpd'	,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('project_allocation_monthly'	,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('application_status'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('owner_company_name'		,'TEXT'		,''		,''	,150		,''	,True		,''		,'')
-		,('owner_first_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('owner_last_name'		,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('legacy_apnum'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('nwf_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('wps_permit'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-	]
+FIELDS_WUP_WELLS = (
+	#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
+	('cu_apnum'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('cu_permit'			,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
+	,('ownerlast'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('ownerfirst'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
+	,('address'			,'TEXT'		,''		,''	,500		,''	,True		,''		,'')
+	,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('pmtmaxgpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('pmtavggpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('primaryuse'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('other_uses'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+	,('expire_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
+	,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
+	,('wps_permit'			,'TEXT'		,''		,''	,10		,''	,True		,''		,'')
+	,('nwf_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('well_key'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
+	,('loc_method'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
+)
 
 
-	add_fields(
-		table = fc_reg_station
-		,fields_spec = fields_spec
-	)
+#
+# Feature class definitions
+#
+# Indexed columns are listed in index number order
+#
 
+FCDef = collections.namedtuple('FCDef', 'name path fields indexes')
+
+FEATURE_CLASSES = [
+	FCDef(name = FC_NAME_ERP, path = FC_PATH_ERP, fields = FIELDS_ERP, indexes = ())
+	,FCDef(name = FC_NAME_ERP_SITE, path = FC_PATH_ERP_SITE, fields = FIELDS_ERP_SITE, indexes = ())
+	,FCDef(name = FC_NAME_ERP_SITE_40A_4, path = FC_PATH_ERP_SITE_40A_4, fields = FIELDS_ERP_SITE_BASE, indexes = ())
+	,FCDef(name = FC_NAME_ERP_SITE_40A_44, path = FC_PATH_ERP_SITE_40A_44, fields = FIELDS_ERP_SITE_BASE, indexes = ())
+	,FCDef(name = FC_NAME_ERP_SITE_62_330, path = FC_PATH_ERP_SITE_62_330, fields = FIELDS_ERP_SITE_BASE, indexes = ())
+	,FCDef(name = FC_NAME_ERP_SITE_FORESTRY, path = FC_PATH_ERP_SITE_FORESTRY, fields = FIELDS_ERP_SITE_BASE, indexes = ())
+	,FCDef(name = FC_NAME_MSSW, path = FC_PATH_MSSW, fields = FIELDS_MSSW, indexes = ())
+	,FCDef(name = FC_NAME_REG_STATION, path = FC_PATH_REG_STATION, fields = FIELDS_REG_STATION, indexes = ('FLUWID', 'LEGACY_PERMIT_NUMBER'))
+	,FCDef(name = FC_NAME_WI, path = FC_PATH_WI, fields = FIELDS_WI, indexes = ('NWF_ID', 'STATE_ID'))
+	,FCDef(name = FC_NAME_WPS, path = FC_PATH_WPS, fields = FIELDS_WPS, indexes = ('FLUWID', 'PERMIT_NUMBER'))
+	,FCDef(name = FC_NAME_WUP_PERMITTED, path = FC_PATH_WUP_PERMITTED, fields = FIELDS_WUP_PERMITTED, indexes = ())
+	,FCDef(name = FC_NAME_WUP_SURFACE, path = FC_PATH_WUP_SURFACE, fields = FIELDS_WUP_SURFACE, indexes = ())
+	,FCDef(name = FC_NAME_WUP_WELLS, path = FC_PATH_WUP_WELLS, fields = FIELDS_WUP_WELLS, indexes = ())
+]
+
+# Feature class definitions keyed by command line name, e.g. well_permits for
+# GIS.DATABASES_WELL_PERMITS
+FEATURE_CLASS_CHOICES = dict(
+	(fc.name.split('.')[-1].replace('DATABASES_', '', 1).lower(), fc)
+	for fc in FEATURE_CLASSES
+)
 
-	arcpy.AddMessage('\tCreating indexes')
+# AddFields field descriptions keyed by feature class name, translated from
+# the field specifications once at import
+ADD_FIELDS_DESCRIPTIONS = dict(
+	(fc.name, to_add_fields_desc(fc.fields))
+	for fc in FEATURE_CLASSES
+)
 
-	arcpy.AddIndex_management(
-		fc_reg_station
-		,'FLUWID'
-		,'{table_name}__I1'.format(table_name = FC_NAME_REG_STATION)
-	)
 
-	arcpy.AddIndex_management(
-		fc_reg_station
-		,'LEGACY_PERMIT_NUMBER'
-		,'{table_name}__I2'.format(table_name = FC_NAME_REG_STATION)
-	)
 
+################################################################################
+# Feature class creation
+################################################################################
 
-	arcpy.AddMessage('\tGranting privileges')
+def create_one (
+	fc
+	,force = False
+):
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_reg_station
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+	#
+	# Runs in a worker process, where geoprocessing messages do not reach the
+	# parent; messages are collected as (severity, text) pairs and returned,
+	# with whether the feature class was created or truncated, for the parent
+	# to emit. Errors are returned the same way so that one failed feature
+	# class does not discard the messages of the others.
+	#
+	# Privileges are granted for all successful feature classes at once by
+	# the caller
+	#
 
+	lazy_init()
 
+	messages = []
 
-#
-# GIS.DATABASES_WELL_INVENTORY
-#
+	try:
 
-def create_databases_well_inventory():
+		#
+		# Reuse an existing feature class by truncating it unless forced to
+		# recreate it; the caller has already verified that existing feature
+		# classes are current
+		#
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_WI))
+		if arcpy.Exists(fc.path):
 
-	fc_wi = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_WI
-	)
+			if not force:
 
+				messages.append(('MESSAGE', '\n\nTruncating existing feature class {fc_name}'.format(fc_name = fc.name)))
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_WI
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+				arcpy.TruncateTable_management(in_table = fc.path)
 
+				return (True, messages)
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('nwf_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('site_id'			,'TEXT'		,''		,''	,15		,''	,True		,''		,'')
-		,('site_type'			,'TEXT'		,''		,''	,1		,''	,True		,''		,'')
-		,('well_name'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('first_name'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('last_name'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('well_depth'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('casing_depth'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('use_permit'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('cps_permit'			,'TEXT'		,''		,''	,10		,''	,True		,''		,'')
-		,('state_id'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('spcap'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('calc_trans'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('loc_method'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-	]
+			messages.append(('MESSAGE', '\n\nDeleting existing feature class {fc_name}'.format(fc_name = fc.name)))
 
+			arcpy.Delete_management(in_data = fc.path)
 
-	add_fields(
-		table = fc_wi
-		,fields_spec = fields_spec
-	)
 
+		messages.append(('MESSAGE', '\n\nCreating feature class {fc_name}\n\tAdding fields'.format(fc_name = fc.name)))
 
-	arcpy.AddMessage('\tCreating indexes')
+		template = build_template(
+			fc = fc
+			,messages = messages
+		)
 
-	arcpy.AddIndex_management(
-		fc_wi
-		,'NWF_ID'
-		,'{table_name}__I1'.format(table_name = FC_NAME_WI)
-	)
+		# Delete the template even if the create fails, so that it does not
+		# linger in the in_memory workspace of this worker
+		try:
 
-	arcpy.AddIndex_management(
-		fc_wi
-		,'STATE_ID'
-		,'{table_name}__I2'.format(table_name = FC_NAME_WI)
-	)
+			arcpy.CreateFeatureclass_management(
+				out_path = OUTPUT_GEODATABASE
+				,out_name = fc.name
+				,geometry_type = 'POINT'
+				,template = template
+				,spatial_reference = UTM_16N_NAD83
+				,config_keyword = CONFIG_KEYWORD
+			)
 
+		finally:
 
-	arcpy.AddMessage('\tGranting privileges')
+			arcpy.Delete_management(in_data = template)
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_wi
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
 
+		if fc.indexes:
 
+			create_indexes(
+				fc = fc
+				,messages = messages
+			)
 
-#
-# GIS.DATABASES_WELL_PERMITS
-#
+	except Exception as e:
 
-def create_databases_well_permits():
+		messages.append(('ERROR', '\n\nFailed to create feature class {fc_name}: {error}'.format(fc_name = fc.name, error = e)))
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_WPS))
+		return (False, messages)
 
-	fc_wps = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_WPS
-	)
+	return (True, messages)
 
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_WPS
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+################################################################################
+# Main
+################################################################################
 
+if __name__ == '__main__':
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('permit_number'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('legacy_permit_number'	,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('related_permit_1'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('related_permit_2'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('job_type'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('status'			,'TEXT'		,''		,''	,200		,''	,True		,''		,'')
-		,('official_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('completion_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('exemption'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('owner_first'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('owner_last'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('well_use'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('appl_well_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('appl_casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('wcr_well_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('wcr_casing_depth'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('open_hole_from'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('open_hole_to'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('screen_from'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('screen_to'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('well_street'			,'TEXT'		,''		,''	,60		,''	,True		,''		,'')
-		,('well_street_2'		,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('well_city'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('well_county'			,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('parcel_id'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('latitude'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('longitude'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('township'			,'TEXT'		,''		,''	,3		,''	,True		,''		,'')
-		,('range'			,'TEXT'		,''		,''	,3		,''	,True		,''		,'')
-		,('section'			,'SHORT'	,''		,''	,''		,''	,True		,''		,'')
-		,('cu_permit'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('location_method'		,'TEXT'		,''		,''	,16		,''	,True		,''		,'')
-		,('contractor_license'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('contractor_name'		,'TEXT'		,''		,''	,70		,''	,True		,''		,'')
-		,('wrca'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('arc'				,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('grout_line'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('construction_method'		,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('w62_524'			,'TEXT'		,''		,''	,7		,''	,True		,''		,'')
-		,('stn_id'			,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-	]
 
+	#
+	# Parse arguments
+	#
 
-	add_fields(
-		table = fc_wps
-		,fields_spec = fields_spec
+	parser = argparse.ArgumentParser(
+		description = 'Create feature classes for integration with nonspatial NWFWMD business systems'
 	)
 
+	fc_group = parser.add_mutually_exclusive_group(required = True)
 
-	arcpy.AddMessage('\tCreating indexes')
+	fc_group.add_argument(
+		'--fc'
+		,nargs = '+'
+		,choices = sorted(FEATURE_CLASS_CHOICES)
+		,metavar = 'NAME'
+		,help = 'feature classes to create: {choices}'.format(choices = ', '.join(sorted(FEATURE_CLASS_CHOICES)))
+	)
 
-	arcpy.AddIndex_management(
-		fc_wps
-		,'FLUWID'
-		,'{table_name}__I1'.format(table_name = FC_NAME_WPS)
+	fc_group.add_argument(
+		'--all'
+		,action = 'store_true'
+		,help = 'create all feature classes'
 	)
 
-	arcpy.AddIndex_management(
-		fc_wps
-		,'PERMIT_NUMBER'
-		,'{table_name}__I2'.format(table_name = FC_NAME_WPS)
+	parser.add_argument(
+		'--force'
+		,action = 'store_true'
+		,help = 'delete and recreate existing feature classes instead of truncating them'
 	)
 
+	args = parser.parse_args()
 
-	arcpy.AddMessage('\tGranting privileges')
+	lazy_init()
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_wps
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
 
 
+	#
+	# Select feature classes
+	#
 
-#
-# GIS.DATABASES_WUP_PERMITTED
-#
+	if args.all:
 
-def create_databases_wup_permitted():
+		feature_classes = FEATURE_CLASSES
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_WUP_PERMITTED))
+	else:
 
-	fc_wup = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_WUP_PERMITTED
-	)
+		feature_classes = []
 
+		for fc_key in args.fc:
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_WUP_PERMITTED
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+			if FEATURE_CLASS_CHOICES[fc_key] not in feature_classes:
 
+				feature_classes.append(FEATURE_CLASS_CHOICES[fc_key])
 
-	arcpy.AddMessage('\tAdding fields')
 
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('permit_number'		,'LONG'		,''		,''	,''		,''	,True		,''		,'')
-		,('owner_first_name'		,'TEXT'		,''		,''	,20		,''	,True		,''		,'')
-		,('owner_last_name'		,'TEXT'		,''		,''	,40		,''	,True		,''		,'')
-		,('project_name'		,'TEXT'		,''		,''	,80		,''	,True		,''		,'')
-		,('issue_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('expiration_date'		,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('rule_type'			,'TEXT'		,''		,''	,15		,''	,True		,''		,'')
-	]
 
+	#
+	# Verify existing feature classes before changing any of them
+	#
 
-	add_fields(
-		table = fc_wup
-		,fields_spec = fields_spec
-	)
+	if not args.force:
 
+		outdated_fc_names = [
+			fc.name
+			for fc in feature_classes
+			if arcpy.Exists(fc.path)
+			and not (schema_matches(fc) and indexes_match(fc))
+		]
 
-	arcpy.AddMessage('\tGranting privileges')
+		if outdated_fc_names:
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_wup
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+			for fc_name in outdated_fc_names:
 
+				arcpy.AddError('Existing feature class {fc_name} does not match its field specification or is missing indexes'.format(fc_name = fc_name))
 
+			arcpy.AddError('Specify --force to delete and recreate existing feature classes')
 
-#
-# GIS.DATABASES_WUP_SURFACE
-#
+			sys.exit(1)
 
-def create_databases_wup_surface():
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_WUP_SURFACE))
 
-	fc_wup_surf = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_WUP_SURFACE
-	)
+	#
+	# Verify configuration keyword before deleting or creating anything
+	#
 
+	sde_connection = arcpy.ArcSDESQLExecute(OUTPUT_GEODATABASE)
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_WUP_SURFACE
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
+	keyword_row_count = sde_connection.execute(
+		"SELECT COUNT(*) FROM SDE.DBTUNE WHERE KEYWORD = '{config_keyword}'".format(config_keyword = CONFIG_KEYWORD)
 	)
 
+	if int(keyword_row_count) == 0:
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('cu_apnum'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('cu_permit'			,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('ownerlast'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('ownerfirst'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('address'			,'TEXT'		,''		,''	,500		,''	,True		,''		,'')
-		,('pmtmaxmonthly'		,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('pmtavggpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('primaryuse'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('other_uses'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('expire_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('swstateid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('swkey'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('loc_method'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
+		arcpy.AddError('Configuration keyword {config_keyword} not found in SDE.DBTUNE; see Notes'.format(config_keyword = CONFIG_KEYWORD))
 
+		sys.exit(1)
 
-	add_fields(
-		table = fc_wup_surf
-		,fields_spec = fields_spec
-	)
 
 
-	arcpy.AddMessage('\tGranting privileges')
+	#
+	# Create feature classes
+	#
+
+	# Feature classes are independent of each other, so they are created
+	# concurrently in separate processes, each with its own geodatabase
+	# connection; arcpy is not thread-safe, so threads are not used
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_wup_surf
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
+	worker_count = min(
+		MAX_WORKERS
+		,len(feature_classes)
 	)
 
+	if worker_count > 1:
 
+		# Launch workers with the Python interpreter, not the host
+		# application, when run as an in-process script tool
+		if not os.path.basename(sys.executable).lower().startswith('python'):
 
-#
-# GIS.DATABASES_WUP_WELLS
-#
+			multiprocessing.set_executable(os.path.join(sys.exec_prefix, 'pythonw.exe'))
 
-def create_databases_wup_wells():
+		pool = multiprocessing.Pool(processes = worker_count)
 
-	arcpy.AddMessage('\n\nCreating feature class {fc_name}'.format(fc_name = FC_NAME_WUP_WELLS))
+		try:
 
-	fc_wup_wells = os.path.join(
-		OUTPUT_GEODATABASE
-		,FC_NAME_WUP_WELLS
-	)
+			fc_results = pool.map(
+				functools.partial(create_one, force = args.force)
+				,feature_classes
+			)
 
+		finally:
 
-	arcpy.CreateFeatureclass_management(
-		out_path = OUTPUT_GEODATABASE
-		,out_name = FC_NAME_WUP_WELLS
-		,geometry_type = 'POINT'
-		,spatial_reference = UTM_16N_NAD83
-	)
+			pool.close()
+			pool.join()
 
+	else:
 
-	arcpy.AddMessage('\tAdding fields')
-
-	fields_spec = [
-		#name				,type		,precision	,scale	,length		,alias	,nullable	,required	,domain
-		('cu_apnum'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('cu_permit'			,'TEXT'		,''		,''	,35		,''	,True		,''		,'')
-		,('ownerlast'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('ownerfirst'			,'TEXT'		,''		,''	,30		,''	,True		,''		,'')
-		,('address'			,'TEXT'		,''		,''	,500		,''	,True		,''		,'')
-		,('diameter'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('pmtmaxgpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('pmtavggpd'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('primaryuse'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('other_uses'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-		,('expire_date'			,'DATE'		,''		,''	,''		,''	,True		,''		,'')
-		,('fluwid'			,'TEXT'		,''		,''	,50		,''	,True		,''		,'')
-		,('wps_permit'			,'TEXT'		,''		,''	,10		,''	,True		,''		,'')
-		,('nwf_id'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('well_key'			,'DOUBLE'	,''		,''	,''		,''	,True		,''		,'')
-		,('loc_method'			,'TEXT'		,''		,''	,100		,''	,True		,''		,'')
-	]
+		fc_results = [
+			create_one(
+				fc = fc
+				,force = args.force
+			)
+			for fc in feature_classes
+		]
 
+	for succeeded, messages in fc_results:
 
-	add_fields(
-		table = fc_wup_wells
-		,fields_spec = fields_spec
-	)
+		emit_messages(messages)
 
 
-	arcpy.AddMessage('\tGranting privileges')
 
-	arcpy.ChangePrivileges_management(
-		in_dataset = fc_wup_wells
-		,user = 'GIS_READ'
-		,View = 'GRANT'
-		,Edit = 'AS_IS'
-	)
+	#
+	# Grant privileges on feature classes that were created or truncated,
+	# even if others failed
+	#
 
+	granted_fcs = [
+		fc
+		for fc, (succeeded, messages) in zip(feature_classes, fc_results)
+		if succeeded
+	]
 
-################################################################################
-# Main
-################################################################################
+	if granted_fcs:
 
-if __name__ == '__main__':
+		grant_messages = []
 
+		grant_privileges(
+			fcs = granted_fcs
+			,messages = grant_messages
+		)
 
-	#
-	# Create feature classes
-	#
+		emit_messages(grant_messages)
+
+	if len(granted_fcs) < len(feature_classes):
+
+		arcpy.AddError('One or more feature classes could not be created')
 
-	# create_databases_erp()
-	# create_databases_mssw()
-	# create_databases_erp_site()
-	# create_databases_erp_site_40a_4()
-	# create_databases_erp_site_40a_44()
-	# create_databases_erp_site_62_330()
-	# create_databases_erp_site_forestry()
-	# create_databases_reg_station()
-	# create_databases_well_inventory()
-	create_databases_well_permits()
-	# create_databases_wup_permitted()
-	# create_databases_wup_surface()
-	# create_databases_wup_wells()
+		sys.exit(1)
 
 
 